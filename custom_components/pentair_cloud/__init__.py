@@ -11,8 +11,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ACCESS_TOKEN, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers import device_registry as dr
 
+from .alarm import ALARM_RULES
 from .const import CONF_ID_TOKEN, CONF_REFRESH_TOKEN, DOMAIN
 from .coordinator import (
     PentairDataUpdateCoordinator,
@@ -28,8 +29,6 @@ PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
 async def async_setup_entry(hass: HomeAssistant, entry: PentairConfigEntry) -> bool:
     """Set up Pentair from a config entry."""
-    entry.add_update_listener(update_listener)
-
     client = Pentair(
         username=entry.data.get(CONF_USERNAME),
         access_token=entry.data.get(CONF_ACCESS_TOKEN),
@@ -49,9 +48,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: PentairConfigEntry) -> b
     )
     await coordinator.async_config_entry_first_refresh()
 
+    device_registry = dr.async_get(hass)
     for device in coordinator.get_devices():
+        if device["deviceType"] in ALARM_RULES:
+            # Register the device up front so alarm events can reference it
+            device_registry.async_get_or_create(
+                config_entry_id=entry.entry_id,
+                identifiers={(DOMAIN, device["deviceId"])},
+                name=device.get("productInfo", {}).get("nickName"),
+            )
         device_coordinator = PentairDeviceDataUpdateCoordinator(
-            hass=hass, config_entry=entry, client=client, device_id=device["deviceId"]
+            hass=hass,
+            config_entry=entry,
+            client=client,
+            device_id=device["deviceId"],
+            device_type=device["deviceType"],
         )
         coordinator.device_coordinators.append(device_coordinator)
 
@@ -88,13 +99,8 @@ async def async_remove_entry(hass: HomeAssistant, entry: PentairConfigEntry) ->
         _LOGGER.debug("Failed to logout during entry removal", exc_info=True)
 
 
-async def update_listener(hass: HomeAssistant, entry: PentairConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
-
-
 async def async_remove_config_entry_device(
-    hass: HomeAssistant, config_entry: PentairConfigEntry, device_entry: DeviceEntry
+    hass: HomeAssistant, config_entry: PentairConfigEntry, device_entry: dr.DeviceEntry
 ) -> bool:
     """Remove a config entry from a device."""
     return not any(
@@ -0,0 +1,162 @@
+"""Pentair alarm evaluation."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import Any, Final
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .helpers import convert_timestamp
+
+_LOGGER = logging.getLogger(__name__)
+
+ALARM_DEBOUNCE_REPORTS: Final = 2
+
+
+@dataclass(frozen=True, kw_only=True)
+class PentairAlarmRule:
+    """Pentair alarm rule."""
+
+    key: str
+    is_active: Callable[[dict], bool]
+    debounce: int = ALARM_DEBOUNCE_REPORTS
+
+
+@dataclass
+class PentairAlarmState:
+    """Tracked state of a Pentair alarm."""
+
+    active: bool | None = None
+    onset: datetime | None = None
+    cleared: datetime | None = None
+    pending_since: datetime | None = None
+    pending_count: int = 0
+
+    def update(
+        self, active: bool, observed: datetime, debounce: int, new_report: bool
+    ) -> bool:
+        """Update the state and return true if an event should be fired.
+
+        The first observation is adopted without debouncing and only reported
+        if the alarm is already active. A pending change is only confirmed by
+        new device reports, not by the same report being polled again.
+        """
+        if self.active is None:
+            self.active = active
+            self.onset = observed if active else None
+            return active
+        if active == self.active:
+            self.pending_since = None
+            self.pending_count = 0
+            return False
+        if self.pending_since is None:
+            self.pending_since = observed
+            self.pending_count = 1
+        elif new_report:
+            self.pending_count += 1
+        if self.pending_count < debounce:
+            return False
+        self.active = active
+        if active:
+            self.onset = self.pending_since
+            self.cleared = None
+        else:
+            self.cleared = self.pending_since
+        self.pending_since = None
+        self.pending_count = 0
+        return True
+
+
+ALARM_RULES: dict[str, tuple[PentairAlarmRule, ...]] = {
+    "PPA0": (
+        PentairAlarmRule(
+            key="low_battery",
+            is_active=lambda data: (
+                int(data["fields"]["bvl"]) < 3 or data["fields"]["bft"] == "4"
+            ),
+        ),
+        PentairAlarmRule(
+            key="power_loss",
+            is_active=lambda data: data["fields"]["acp"] != "1",
+        ),
+        PentairAlarmRule(
+            key="primary_pump",
+            is_active=lambda data: int(data["fields"]["sts"]) == 2,
+        ),
+        PentairAlarmRule(
+            key="secondary_pump",
+            is_active=lambda data: int(data["fields"]["sts"]) > 0,
+        ),
+        PentairAlarmRule(
+            key="water_level",
+            is_active=lambda data: int(data["fields"]["sts"]) == 5,
+        ),
+    ),
+}
+
+
+class PentairAlarmEngine:
+    """Evaluate the alarm rules of a device and track transitions."""
+
+    def __init__(self, hass: HomeAssistant, device_id: str, device_type: str | None):
+        """Initialize."""
+        self.hass = hass
+        self.device_id = device_id
+        self.rules = ALARM_RULES.get(device_type, ())
+        self.states = {rule.key: PentairAlarmState() for rule in self.rules}
+        self._last_delivered: Any = None
+
+    @callback
+    def async_evaluate(self, data: dict) -> list[dict[str, Any]]:
+        """Evaluate all rules against the latest device data.
+
+        Return the event data of the alarms that transitioned.
+        """
+        ts = data.get("delivered")
+        observed = convert_timestamp(ts) if ts else dt_util.utcnow()
+        new_report = not ts or ts != self._last_delivered
+        self._last_delivered = ts
+
+        events: list[dict[str, Any]] = []
+        for rule in self.rules:
+            try:
+                active = bool(rule.is_active(data))
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.debug(
+                    "Unable to evaluate %s alarm for device %s: %s",
+                    rule.key,
+                    self.device_id,
+                    err,
+                )
+                continue
+            state = self.states[rule.key]
+            initial = state.active is None
+            if state.update(active, observed, rule.debounce, new_report):
+                device = dr.async_get(self.hass).async_get_device(
+                    identifiers={(DOMAIN, self.device_id)}
+                )
+                events.append(
+                    {
+                        "device_id": device.id if device else None,
+                        "pentair_device_id": self.device_id,
+                        "alarm": rule.key,
+                        "initial": initial,
+                        "active": state.active,
+                        "onset": state.onset.isoformat() if state.onset else None,
+                        "cleared": state.cleared.isoformat() if state.cleared else None,
+                    }
+                )
+        return events
+
+    def is_active(self, key: str) -> bool | None:
+        """Return whether an alarm is active, or None if it is unknown."""
+        if (state := self.states.get(key)) is None:
+            return None
+        return state.active
@@ -23,7 +23,9 @@ from .helpers import get_field_value
 class PentairBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Pentair binary sensor entity description."""
 
-    is_on: Callable[[dict], bool]
+    is_on: Callable[[dict], bool] | None = None
+    alarm: str | None = None
+    inverted: bool = False
 
 
 SENSOR_MAP: dict[str | None, tuple[PentairBinarySensorEntityDescription, ...]] = {
@@ -40,9 +42,7 @@ SENSOR_MAP: dict[str | None, tuple[PentairBinarySensorEntityDescription, ...]] =
             device_class=BinarySensorDeviceClass.BATTERY,
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="low_battery",
-            is_on=lambda data: (
-                int(data["fields"]["bvl"]) < 3 or data["fields"]["bft"] == "4"
-            ),
+            alarm="low_battery",
         ),
         PentairBinarySensorEntityDescription(
             key="battery_charging",
@@ -62,25 +62,26 @@ SENSOR_MAP: dict[str | None, tuple[PentairBinarySensorEntityDescription, ...]] =
             device_class=BinarySensorDeviceClass.POWER,
             entity_category=EntityCategory.DIAGNOSTIC,
             translation_key="power",
-            is_on=lambda data: data["fields"]["acp"] == "1",
+            alarm="power_loss",
+            inverted=True,
         ),
         PentairBinarySensorEntityDescription(
             key="primary_pump",
             device_class=BinarySensorDeviceClass.PROBLEM,
             translation_key="primary_pump",
-            is_on=lambda data: data["fields"]["sts"] == "2",
+            alarm="primary_pump",
         ),
         PentairBinarySensorEntityDescription(
             key="secondary_pump",
             device_class=BinarySensorDeviceClass.PROBLEM,
             translation_key="secondary_pump",
-            is_on=lambda data: int(data["fields"]["sts"]) > 0,
+            alarm="secondary_pump",
         ),
         PentairBinarySensorEntityDescription(
             key="water_level",
             device_class=BinarySensorDeviceClass.PROBLEM,
             translation_key="water_level",
-            is_on=lambda data: data["fields"]["sts"] == 5,
+            alarm="water_level",
         ),
     ),
 }
@@ -96,12 +97,14 @@ async def async_setup_entry(
 
     entities = [
         PentairBinarySensorEntity(
-            coordinator=coordinator,
+            coordinator=device_coordinator,
             config_entry=config_entry,
             description=description,
             device_id=device["deviceId"],
         )
-        for device in coordinator.get_devices()
+        for device_coordinator in coordinator.device_coordinators
+        if device_coordinator.get_device_data()
+        if (device := coordinator.get_device(device_coordinator.device_id))
         for device_type, descriptions in SENSOR_MAP.items()
         for description in descriptions
         if device_type is None or device["deviceType"] == device_type
@@ -121,6 +124,12 @@ class PentairBinarySensorEntity(PentairEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if isinstance(device_data := self.get_device(), dict):
-            return self.entity_description.is_on(device_data)
+        if (alarm := self.entity_description.alarm) is not None:
+            if (active := self.coordinator.alarms.is_active(alarm)) is None:
+                return None
+            return active is not self.entity_description.inverted
+        if (is_on := self.entity_description.is_on) is not None and isinstance(
+            device_data := self.get_device(), dict
+        ):
+            return is_on(device_data)
         return None
@@ -8,11 +8,12 @@ from typing import Any
 from pypentair import Pentair, PentairAuthenticationError
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .const import CONF_DIAGNOSTICS_SUMMARY, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -25,6 +26,12 @@ class PentairConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return PentairOptionsFlow()
+
     async def _async_create_entry(self, user_input: dict[str, Any]) -> FlowResult:
         """Create the config entry."""
         existing_entry = await self.async_set_unique_id(DOMAIN)
@@ -116,3 +123,28 @@ class PentairConfigFlow(ConfigFlow, domain=DOMAIN):
         return await self.async_pentair_login(
             step_id="reauth_confirm", user_input=user_input, schema=reauth_schema
         )
+
+
+class PentairOptionsFlow(OptionsFlow):
+    """Handle an options flow for Pentair."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_DIAGNOSTICS_SUMMARY,
+                        default=self.config_entry.options.get(
+                            CONF_DIAGNOSTICS_SUMMARY, False
+                        ),
+                    ): bool
+                }
+            ),
+        )
@@ -6,5 +6,9 @@ from typing import Final
 
 DOMAIN: Final = "pentair_cloud"
 
+EVENT_ALARM: Final = f"{DOMAIN}_alarm"
+
 CONF_ID_TOKEN: Final = "id_token"
 CONF_REFRESH_TOKEN: Final = "refresh_token"
+
+CONF_DIAGNOSTICS_SUMMARY: Final = "diagnostics_summary"
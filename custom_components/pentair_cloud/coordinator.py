@@ -2,21 +2,25 @@
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import timedelta
 import logging
+from time import monotonic
 from typing import Any
 
 from deepdiff import DeepDiff
 from pypentair import Pentair
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .alarm import PentairAlarmEngine
+from .const import DOMAIN, EVENT_ALARM
 
 _LOGGER = logging.getLogger(__name__)
 UPDATE_INTERVAL = 30
+UPDATE_DURATION_SAMPLES = 20
 
 
 class PentairDataUpdateCoordinator(DataUpdateCoordinator):
@@ -29,6 +33,7 @@ class PentairDataUpdateCoordinator(DataUpdateCoordinator):
         self.api = client
         self.devices: dict[str, list[dict[str, Any]]] = {}
         self.device_coordinators: list[PentairDeviceDataUpdateCoordinator] = []
+        self.update_durations: deque[float] = deque(maxlen=UPDATE_DURATION_SAMPLES)
 
         super().__init__(
             hass,
@@ -60,7 +65,10 @@ class PentairDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self):
         """Update data via library, refresh token if necessary."""
         try:
-            if devices := await self.hass.async_add_executor_job(self.api.get_devices):
+            start = monotonic()
+            devices = await self.hass.async_add_executor_job(self.api.get_devices)
+            self.update_durations.append(monotonic() - start)
+            if devices:
                 diff = DeepDiff(
                     self.devices,
                     devices,
@@ -85,10 +93,13 @@ class PentairDeviceDataUpdateCoordinator(DataUpdateCoordinator):
         config_entry: ConfigEntry,
         client: Pentair,
         device_id: str,
+        device_type: str | None = None,
     ) -> None:
         """Initialize."""
         self.api = client
         self.device_id = device_id
+        self.alarms = PentairAlarmEngine(hass, device_id, device_type)
+        self.update_durations: deque[float] = deque(maxlen=UPDATE_DURATION_SAMPLES)
 
         super().__init__(
             hass,
@@ -104,12 +115,25 @@ class PentairDeviceDataUpdateCoordinator(DataUpdateCoordinator):
             return data
         return None
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, then fire alarm events for the new data."""
+        events = []
+        if self.last_update_success and (data := self.get_device_data()):
+            events = self.alarms.async_evaluate(data)
+        super().async_update_listeners()
+        for event_data in events:
+            self.hass.bus.async_fire(EVENT_ALARM, event_data)
+
     async def _async_update_data(self):
         """Update data via library, refresh token if necessary."""
         try:
-            if device := await self.hass.async_add_executor_job(
+            start = monotonic()
+            device = await self.hass.async_add_executor_job(
                 self.api.get_device, self.device_id
-            ):
+            )
+            self.update_durations.append(monotonic() - start)
+            if device:
                 diff = DeepDiff(
                     self.data,
                     device,
@@ -2,26 +2,104 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+from time import monotonic
 from typing import Any
 
 from homeassistant.components.diagnostics.util import async_redact_data
 from homeassistant.core import HomeAssistant
 
 from . import PentairConfigEntry
+from .const import CONF_DIAGNOSTICS_SUMMARY
+from .coordinator import (
+    PentairDataUpdateCoordinator,
+    PentairDeviceDataUpdateCoordinator,
+)
 
 TO_REDACT = {"arn", "deviceId", "email", "userId"}
 
 
+def _describe(data: Mapping[str, Any]) -> dict[str, str]:
+    """Return the keys and value types of a mapping."""
+    return {key: type(value).__name__ for key, value in data.items()}
+
+
+def _timing(
+    coordinator: PentairDataUpdateCoordinator | PentairDeviceDataUpdateCoordinator,
+) -> dict[str, Any]:
+    """Return update timing stats of a coordinator."""
+    durations = coordinator.update_durations
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "samples": len(durations),
+        "last": durations[-1] if durations else None,
+        "min": min(durations, default=None),
+        "max": max(durations, default=None),
+        "mean": sum(durations) / len(durations) if durations else None,
+    }
+
+
+def _summarize_device(device: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a compact summary of a device payload."""
+    return {
+        "keys": _describe(device),
+        "fields": {
+            field: type(
+                value.get("value", value) if isinstance(value, dict) else value
+            ).__name__
+            for field, value in device.get("fields", {}).items()
+        },
+    }
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: PentairConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data
-    diagnostics_data = {
-        "get_devices": coordinator.data,
-        "get_device": {
-            "***" + device_coordinator.device_id[-4:]: device_coordinator.data
-            for device_coordinator in coordinator.device_coordinators
+    summary = entry.options.get(CONF_DIAGNOSTICS_SUMMARY, False)
+    start = monotonic()
+
+    get_devices = async_redact_data(
+        {
+            key: value
+            for key, value in (coordinator.data or {}).items()
+            if key != "data"
         },
+        TO_REDACT,
+    )
+    get_devices["data"] = []
+    for device in coordinator.get_devices():
+        get_devices["data"].append(
+            _summarize_device(device)
+            if summary
+            else async_redact_data(device, TO_REDACT)
+        )
+        await asyncio.sleep(0)
+
+    get_device: dict[str, Any] = {}
+    for device_coordinator in coordinator.device_coordinators:
+        data = device_coordinator.data or {}
+        device = async_redact_data(
+            {key: value for key, value in data.items() if key != "data"}, TO_REDACT
+        )
+        device_data = data.get("data")
+        device["data"] = (
+            _summarize_device(device_data)
+            if summary and isinstance(device_data, Mapping)
+            else async_redact_data(device_data, TO_REDACT)
+        )
+        if summary:
+            device["timing"] = _timing(device_coordinator)
+        get_device["***" + device_coordinator.device_id[-4:]] = device
+        await asyncio.sleep(0)
+
+    diagnostics_data: dict[str, Any] = {
+        "get_devices": get_devices,
+        "get_device": get_device,
     }
-    return async_redact_data(diagnostics_data, TO_REDACT)
+    if summary:
+        diagnostics_data["timing"] = _timing(coordinator)
+    diagnostics_data["generation_duration"] = monotonic() - start
+    return diagnostics_data